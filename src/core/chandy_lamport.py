@@ -1,16 +1,64 @@
+import pickle
+import struct
+from array import array
+
 from loguru import logger
-from typing import Optional
+from typing import BinaryIO, Optional
 
 
 class ChandyLamport:
+    __slots__ = ("_msg_intern", "_msg_table", "channels",
+                 "_snapshot_chunks", "_chunk_live", "_snapshot_index",
+                 "_snapshot_pool")
+
+    # Snapshots are packed into chunks of this many bytes, so per-snapshot
+    # storage overhead is a three-tuple index entry instead of a live dict.
+    SNAPSHOT_CHUNK_SIZE = 128 * 1024
+
     def __init__(self):
         """
         Initializes the Chandy-Lamport algorithm state.
         """
-        self.channels: dict[str, list[str]] = {}
-        self.snapshots: dict[str, dict[str, list[str] | str]] = {}
+        # Messages are dictionary-encoded: each distinct message is stored once
+        # in the table and channels carry uint32 indices into it, so repeated
+        # messages cost four bytes apiece.
+        self._msg_intern: dict[str, int] = {}
+        self._msg_table: list[str] = []
+        self.channels: dict[str, array] = {}
+        self._snapshot_chunks: list[bytearray] = []
+        # Live bytes per chunk: a chunk whose count drops to zero has only
+        # dead snapshots in it and its buffer is reclaimed.
+        self._chunk_live: list[int] = []
+        self._snapshot_index: dict[str, tuple[int, int, int]] = {}  # (chunk, offset, length)
+        self._snapshot_pool: list[dict[str, array | str]] = []
         logger.info("Chandy-Lamport system initialized.")
 
+    def _intern_message(self, message: str) -> int:
+        """
+        Returns the table index for a message, assigning one on first sight.
+        """
+        index = self._msg_intern.get(message)
+        if index is None:
+            index = self._msg_intern[message] = len(self._msg_table)
+            self._msg_table.append(message)
+        return index
+
+    def _acquire_snapshot_dict(self) -> dict[str, array | str]:
+        """
+        Returns an empty snapshot dictionary, reusing one from the pool when
+        available so steady-state captures allocate nothing.
+        """
+        if self._snapshot_pool:
+            return self._snapshot_pool.pop()
+        return {}
+
+    def _release_snapshot_dict(self, snapshot: dict[str, array | str]) -> None:
+        """
+        Clears a snapshot dictionary and returns it to the pool for reuse.
+        """
+        snapshot.clear()
+        self._snapshot_pool.append(snapshot)
+
     def send_message(self, sender: str, receiver: str, message: str) -> None:
         """
         Simulates sending a message between processes.
@@ -20,32 +68,80 @@ class ChandyLamport:
             receiver (str): The ID of the receiving process.
             message (str): The content of the message.
         """
-        logger.debug(f"Sending message from {sender} to {receiver}: {message}")
-        self.channels.setdefault(receiver, []).append(message)
-        logger.info(f"Message sent from {sender} to {receiver}: {message}")
-        logger.debug(f"Updated channels state: {self.channels}")
+        logger.debug("Sending message from {} to {}: {}", sender, receiver, message)
+        self.channels.setdefault(receiver, array("I")).append(self._intern_message(message))
+        logger.info("Message sent from {} to {}: {}", sender, receiver, message)
+        logger.opt(lazy=True).debug("Updated channels state: {}", lambda: self.channels)
 
     def capture_snapshot(self, process_id: str) -> None:
         """
         Captures the state of a process and the messages it has received.
 
+        The process's channel is swapped for a fresh index array rather than
+        copied: the in-transit messages are swept into the snapshot, as the
+        algorithm prescribes, without ever duplicating the buffer.
+
         Args:
             process_id (str): The ID of the process to capture.
         """
-        logger.debug(f"Capturing snapshot for process {process_id}.")
-        received_messages = self.channels.get(process_id, [])
-        snapshot = {
-            "received_messages": received_messages.copy(),
-            "state": f"State of {process_id}",  # Placeholder for actual state capture.
-        }
-        self.snapshots[process_id] = snapshot
-        logger.info(f"Snapshot captured for process {process_id}.")
-        logger.debug(f"Snapshot details: {snapshot}")
-        logger.debug(f"Updated snapshots state: {self.snapshots}")
+        logger.debug("Capturing snapshot for process {}.", process_id)
+        received_messages = self.channels.get(process_id)
+        if received_messages is None:
+            received_messages = array("I")
+        else:
+            self.channels[process_id] = array("I")
+        snapshot = self._acquire_snapshot_dict()
+        snapshot["received_messages"] = received_messages
+        snapshot["state"] = f"State of {process_id}"  # Placeholder for actual state capture.
+        self._store_snapshot(process_id, snapshot)
+        self._release_snapshot_dict(snapshot)
+        logger.info("Snapshot captured for process {}.", process_id)
+        logger.opt(lazy=True).debug("Updated snapshot index: {}", lambda: self._snapshot_index)
+
+    def _store_snapshot(self, process_id: str, snapshot: dict[str, array | str]) -> None:
+        """
+        Serializes a snapshot and appends it to the tail storage chunk,
+        rolling over to a fresh chunk once the tail reaches the chunk size.
+        """
+        self._evict_snapshot(process_id)  # A re-capture kills the old blob.
+        blob = pickle.dumps(snapshot, protocol=5)
+        if not self._snapshot_chunks or len(self._snapshot_chunks[-1]) >= self.SNAPSHOT_CHUNK_SIZE:
+            self._snapshot_chunks.append(bytearray())
+            self._chunk_live.append(0)
+        tail = self._snapshot_chunks[-1]
+        self._snapshot_index[process_id] = (len(self._snapshot_chunks) - 1, len(tail), len(blob))
+        self._chunk_live[-1] += len(blob)
+        tail += blob
+
+    def _evict_snapshot(self, process_id: str) -> None:
+        """
+        Drops a process's index entry and its share of chunk storage. A chunk
+        is reclaimed once every snapshot in it is dead; the empty bytearray
+        keeps its slot so chunk numbers in the index stay valid.
+        """
+        entry = self._snapshot_index.pop(process_id, None)
+        if entry is None:
+            return
+        chunk, _, length = entry
+        self._chunk_live[chunk] -= length
+        if self._chunk_live[chunk] == 0:
+            self._snapshot_chunks[chunk] = bytearray()
+
+    def _load_snapshot(self, process_id: str) -> Optional[dict[str, array | str]]:
+        """
+        Rebuilds a snapshot from its chunk slice, or returns None if the
+        process has no stored snapshot.
+        """
+        entry = self._snapshot_index.get(process_id)
+        if entry is None:
+            return None
+        chunk, offset, length = entry
+        return pickle.loads(bytes(self._snapshot_chunks[chunk][offset:offset + length]))
 
     def get_snapshot(self, process_id: str) -> Optional[dict[str, list[str] | str]]:
         """
-        Retrieves the snapshot of a specific process.
+        Retrieves the snapshot of a specific process, projecting the stored
+        message indices back into message strings.
 
         Args:
             process_id (str): The ID of the process whose snapshot is needed.
@@ -53,14 +149,61 @@ class ChandyLamport:
         Returns:
             dict[str, list[str] | str] | None: The snapshot of the process, or None if not available.
         """
-        logger.debug(f"Retrieving snapshot for process {process_id}.")
-        snapshot = self.snapshots.get(process_id)
+        logger.debug("Retrieving snapshot for process {}.", process_id)
+        snapshot = self._load_snapshot(process_id)
         if snapshot:
-            logger.info(f"Snapshot retrieved for process {process_id}: {snapshot}")
+            table = self._msg_table
+            snapshot["received_messages"] = [table[index] for index in snapshot["received_messages"]]
+            logger.info("Snapshot retrieved for process {}: {}", process_id, snapshot)
         else:
-            logger.warning(f"No snapshot found for process {process_id}.")
+            logger.warning("No snapshot found for process {}.", process_id)
         return snapshot
 
+    def get_snapshot_stream(self, process_id: str, writer: BinaryIO) -> bool:
+        """
+        Streams the snapshot of a specific process to a binary writer.
+
+        Records are framed as a little-endian uint32 byte length followed by
+        the UTF-8 payload: one frame per received message, then one for the
+        process state. Nothing beyond a single frame is held in memory, so
+        large snapshots can be piped to a file or socket without being
+        materialized.
+
+        Args:
+            process_id (str): The ID of the process whose snapshot is needed.
+            writer (BinaryIO): The binary stream the framed records are written to.
+
+        Returns:
+            bool: True if the snapshot was streamed, False if none exists.
+        """
+        snapshot = self._load_snapshot(process_id)
+        if snapshot is None:
+            logger.warning("No snapshot found for process {}.", process_id)
+            return False
+        table = self._msg_table
+        for index in snapshot["received_messages"]:
+            payload = table[index].encode("utf-8")
+            writer.write(struct.pack("<I", len(payload)))
+            writer.write(payload)
+        state = snapshot["state"].encode("utf-8")
+        writer.write(struct.pack("<I", len(state)))
+        writer.write(state)
+        logger.info("Snapshot streamed for process {}.", process_id)
+        return True
+
+    def release_snapshot(self, process_id: str) -> None:
+        """
+        Discards a process's snapshot once its reader is done with it.
+
+        Args:
+            process_id (str): The ID of the process whose snapshot is released.
+        """
+        if process_id not in self._snapshot_index:
+            logger.warning("No snapshot to release for process {}.", process_id)
+            return
+        self._evict_snapshot(process_id)
+        logger.debug("Snapshot released for process {}.", process_id)
+
 
 if __name__ == "__main__":
     logger.info("Starting Chandy-Lamport example system.")
@@ -79,4 +222,4 @@ if __name__ == "__main__":
     logger.info("Retrieving and printing all snapshots.")
     for process_id in ["A", "B"]:
         snapshot = system.get_snapshot(process_id)
-        logger.debug(f"Process {process_id} snapshot: {snapshot}")
+        logger.debug("Process {} snapshot: {}", process_id, snapshot)
@@ -1,28 +1,127 @@
 import time
 import threading
+from contextlib import contextmanager
 from loguru import logger
-from typing import Optional
+from typing import Iterator, Optional
+
+
+class ReadWriteLock:
+    """
+    A reader-biased readers-writer lock.
+
+    acquire/release take the exclusive (write) side, so an instance can be
+    used directly as a context manager — or as the lock behind a
+    threading.Condition — by code that mutates shared state. read_locked()
+    grants shared access: any number of readers may hold it at once, with the
+    first reader blocking writers and the last one letting them back in.
+    """
+
+    def __init__(self):
+        self._readers_lock = threading.Lock()  # Guards the reader count.
+        self._readers = 0
+        self._write_lock = threading.Lock()  # Held by a writer or the reader group.
+
+    def acquire(self, blocking: bool = True, timeout: float = -1) -> bool:
+        """
+        Acquires the exclusive write side of the lock.
+        """
+        return self._write_lock.acquire(blocking, timeout)
+
+    def release(self) -> None:
+        """
+        Releases the exclusive write side of the lock.
+        """
+        self._write_lock.release()
+
+    __enter__ = acquire
+
+    def __exit__(self, *args) -> None:
+        self.release()
+
+    @contextmanager
+    def read_locked(self) -> Iterator[None]:
+        """
+        Context manager granting shared read access.
+        """
+        with self._readers_lock:
+            self._readers += 1
+            if self._readers == 1:
+                self._write_lock.acquire()
+        try:
+            yield
+        finally:
+            with self._readers_lock:
+                self._readers -= 1
+                if self._readers == 0:
+                    self._write_lock.release()
 
 
 class Zookeeper:
     """
     Simulates a basic Zookeeper service with node management and distributed lock functionality.
 
+    State is striped across a fixed number of shards keyed by the hash of the
+    path, so operations on unrelated paths never contend on the same lock.
+    Each shard keeps a single entry table mapping a path to its [value, owner]
+    pair: node reads, node writes and lock transfers on a path all resolve
+    with one hash probe instead of consulting separate nodes and locks
+    dictionaries.
+
+    Waiters blocked on a locked path park on a per-path threading.Condition
+    bound to the shard lock, and are woken by unlock_node instead of polling.
+
     Attributes:
-        nodes (dict): A dictionary storing the nodes with their paths as keys and values as values.
-        locks (dict): A dictionary storing the locked nodes with paths as keys and lock statuses as values.
-        lock (threading.Lock): A threading lock used to ensure thread-safe operations on nodes and locks.
+        _shards (list): A list of (ReadWriteLock, entries dict, conditions dict)
+            tuples, one per stripe, each guarding its own slice of the keyspace.
     """
-    
+
+    SHARD_COUNT = 16  # Power of two so the shard index reduces to a bit mask.
+
+    # Offsets into a path's [value, owner] entry.
+    VALUE = 0
+    OWNER = 1
+
     def __init__(self):
         """
-        Initializes the Zookeeper simulation with an empty nodes dictionary,
-        an empty locks dictionary, and a threading lock for synchronization.
+        Initializes the Zookeeper simulation with one empty entry table,
+        conditions dictionary, and threading lock per shard.
         """
-        self.nodes: dict[str, str] = {}  # Stores nodes (keys and values) in the simulated Zookeeper.
-        self.locks: dict[str, str] = {}  # Tracks locked nodes with the client using the lock.
-        self.lock = threading.Lock()  # Ensures exclusive access to data structures.
-    
+        self._shards: list[tuple[ReadWriteLock, dict[str, list], dict[str, threading.Condition]]] = []
+        for _ in range(self.SHARD_COUNT):
+            self._shards.append((ReadWriteLock(), {}, {}))
+
+    def _shard(self, path: str) -> tuple[ReadWriteLock, dict[str, list], dict[str, threading.Condition]]:
+        """
+        Returns the (lock, entries, conditions) shard responsible for the given path.
+
+        Args:
+            path (str): The node path to resolve.
+
+        Returns:
+            tuple: The shard tuple guarding the slice of the keyspace the path hashes into.
+        """
+        return self._shards[hash(path) & (self.SHARD_COUNT - 1)]
+
+    @staticmethod
+    def _condition(shard: tuple[ReadWriteLock, dict[str, list], dict[str, threading.Condition]],
+                   path: str) -> threading.Condition:
+        """
+        Returns the condition used to signal lock releases on the given path,
+        creating it on first use. Must be called with the shard lock held.
+
+        Args:
+            shard (tuple): The shard responsible for the path.
+            path (str): The node path the condition is associated with.
+
+        Returns:
+            threading.Condition: The condition bound to the shard lock.
+        """
+        lock, _, conds = shard
+        cond = conds.get(path)
+        if cond is None:
+            cond = conds[path] = threading.Condition(lock)
+        return cond
+
     def create_node(self, path: str, value: str) -> bool:
         """
         Creates a new node at the specified path with a given value.
@@ -34,15 +133,19 @@ class Zookeeper:
         Returns:
             bool: True if the node was created, False if the node already exists.
         """
-        with self.lock:
-            if path not in self.nodes:
-                self.nodes[path] = value
-                logger.info(f"Node created at {path} with value: {value}")
-                return True
+        lock, entries, _ = self._shard(path)
+        with lock:
+            entry = entries.get(path)
+            if entry is None:
+                entries[path] = [value, None]
+            elif entry[self.VALUE] is None:
+                entry[self.VALUE] = value
             else:
-                logger.warning(f"Node at {path} already exists.")
+                logger.warning("Node at {} already exists.", path)
                 return False
-    
+            logger.info("Node created at {} with value: {}", path, value)
+            return True
+
     def get_node(self, path: str) -> Optional[str]:
         """
         Retrieves the value of the node at the specified path.
@@ -53,9 +156,11 @@ class Zookeeper:
         Returns:
             Optional[str]: The value of the node if it exists, or None if the node does not exist.
         """
-        with self.lock:
-            return self.nodes.get(path)
-    
+        lock, entries, _ = self._shard(path)
+        with lock.read_locked():
+            entry = entries.get(path)
+            return entry[self.VALUE] if entry is not None else None
+
     def set_node(self, path: str, value: str) -> bool:
         """
         Updates the value of an existing node at the specified path.
@@ -67,15 +172,17 @@ class Zookeeper:
         Returns:
             bool: True if the node was updated, False if the node does not exist.
         """
-        with self.lock:
-            if path in self.nodes:
-                self.nodes[path] = value
-                logger.info(f"Node at {path} updated with value: {value}")
+        lock, entries, _ = self._shard(path)
+        with lock:
+            entry = entries.get(path)
+            if entry is not None and entry[self.VALUE] is not None:
+                entry[self.VALUE] = value
+                logger.info("Node at {} updated with value: {}", path, value)
                 return True
             else:
-                logger.warning(f"Node at {path} does not exist.")
+                logger.warning("Node at {} does not exist.", path)
                 return False
-    
+
     def lock_node(self, path: str, client_id: str) -> bool:
         """
         Acquires a lock for the node at the specified path by a client.
@@ -87,16 +194,59 @@ class Zookeeper:
         Returns:
             bool: True if the lock was acquired, False if the node is already locked by another client.
         """
-        with self.lock:
-            if path not in self.locks:
-                self.locks[path] = client_id
-                logger.info(f"Lock acquired at {path} by client {client_id}.")
+        lock, entries, _ = self._shard(path)
+        with lock:
+            entry = entries.setdefault(path, [None, None])
+            if entry[self.OWNER] is None:
+                entry[self.OWNER] = client_id
+                logger.info("Lock acquired at {} by client {}.", path, client_id)
                 return True
             else:
-                current_client = self.locks[path]
-                logger.warning(f"Node at {path} is already locked by client {current_client}.")
+                current_client = entry[self.OWNER]
+                logger.warning("Node at {} is already locked by client {}.", path, current_client)
                 return False
-    
+
+    def acquire_blocking(self, path: str, client_id: str) -> None:
+        """
+        Acquires the lock for the node at the specified path, blocking until it is free.
+
+        Instead of polling, the caller parks on the path's condition and is woken
+        by unlock_node when the current holder releases the lock.
+
+        Args:
+            path (str): The path of the node to lock.
+            client_id (str): The identifier of the client requesting the lock.
+        """
+        self._acquire_blocking_on(self._shard(path), path, client_id)
+
+    def _resolve_path(self, path: str) -> tuple[ReadWriteLock, dict[str, list], dict[str, threading.Condition]]:
+        """
+        Resolves a path to its shard handle once, so callers that operate on
+        the same path repeatedly can skip the per-call hash and shard lookup.
+
+        Args:
+            path (str): The node path to resolve.
+
+        Returns:
+            tuple: The (lock, entries, conditions) shard responsible for the path.
+        """
+        return self._shard(path)
+
+    def _acquire_blocking_on(self,
+                             shard: tuple[ReadWriteLock, dict[str, list], dict[str, threading.Condition]],
+                             path: str, client_id: str) -> None:
+        """
+        acquire_blocking body operating on an already-resolved shard handle.
+        """
+        lock, entries, _ = shard
+        with lock:
+            entry = entries.setdefault(path, [None, None])
+            while entry[self.OWNER] is not None:
+                logger.debug("Client {} waiting for lock at {} held by {}.", client_id, path, entry[self.OWNER])
+                self._condition(shard, path).wait()
+            entry[self.OWNER] = client_id
+            logger.info("Lock acquired at {} by client {}.", path, client_id)
+
     def unlock_node(self, path: str, client_id: str) -> bool:
         """
         Releases the lock for the node at the specified path by a client.
@@ -108,13 +258,24 @@ class Zookeeper:
         Returns:
             bool: True if the lock was released, False if the node was not locked or the client is not the one holding the lock.
         """
-        with self.lock:
-            if path in self.locks and self.locks[path] == client_id:
-                del self.locks[path]
-                logger.info(f"Lock released at {path} by client {client_id}.")
+        return self._unlock_on(self._shard(path), path, client_id)
+
+    def _unlock_on(self,
+                   shard: tuple[ReadWriteLock, dict[str, list], dict[str, threading.Condition]],
+                   path: str, client_id: str) -> bool:
+        """
+        unlock_node body operating on an already-resolved shard handle.
+        """
+        lock, entries, _ = shard
+        with lock:
+            entry = entries.get(path)
+            if entry is not None and entry[self.OWNER] == client_id:
+                entry[self.OWNER] = None
+                self._condition(shard, path).notify_all()
+                logger.info("Lock released at {} by client {}.", path, client_id)
                 return True
             else:
-                logger.warning(f"Client {client_id} failed to release lock at {path} (lock not held or held by another client).")
+                logger.warning("Client {} failed to release lock at {} (lock not held or held by another client).", client_id, path)
                 return False
 
 
@@ -128,10 +289,15 @@ class DistributedLock:
         client_id (str): The unique identifier for the client.
     """
 
+    __slots__ = ("zookeeper", "lock_path", "client_id", "_handle")
+
     def __init__(self, zookeeper: Zookeeper, lock_path: str, client_id: str):
         """
         Initializes the DistributedLock with the Zookeeper instance, lock path, and client ID.
 
+        The lock path's shard handle is resolved once here, so acquire and
+        release skip the path hash and shard lookup on every call.
+
         Args:
             zookeeper (Zookeeper): The Zookeeper instance used to manage locks.
             lock_path (str): The path of the node to lock and unlock.
@@ -140,19 +306,18 @@ class DistributedLock:
         self.zookeeper = zookeeper
         self.lock_path = lock_path
         self.client_id = client_id
-    
+        self._handle = zookeeper._resolve_path(lock_path)
+
     def acquire_lock(self) -> None:
         """
-        Attempts to acquire the lock at the specified lock path by the client.
+        Acquires the lock at the specified lock path by the client.
 
-        This method will keep trying to acquire the lock until it succeeds. It simulates
-        the behavior of a worker attempting to acquire a distributed lock and may retry
-        with random delays if the lock is unavailable.
+        This method blocks until the lock is available. The client parks on the
+        lock's condition inside Zookeeper and is woken as soon as the current
+        holder releases it, rather than retrying on a polling delay.
         """
-        while not self.zookeeper.lock_node(self.lock_path, self.client_id):
-            logger.debug(f"Client {self.client_id} waiting to acquire lock at {self.lock_path}...")
-            time.sleep(2)  # Random delay before retrying.
-    
+        self.zookeeper._acquire_blocking_on(self._handle, self.lock_path, self.client_id)
+
     def release_lock(self) -> None:
         """
         Releases the lock at the specified lock path by the client.
@@ -160,10 +325,10 @@ class DistributedLock:
         If the lock is successfully released, an info message is logged. If the lock was
         not previously acquired, an error message is logged.
         """
-        if self.zookeeper.unlock_node(self.lock_path, self.client_id):
-            logger.info(f"Client {self.client_id} released lock at {self.lock_path} successfully.")
+        if self.zookeeper._unlock_on(self._handle, self.lock_path, self.client_id):
+            logger.info("Client {} released lock at {} successfully.", self.client_id, self.lock_path)
         else:
-            logger.error(f"Client {self.client_id} failed to release lock at {self.lock_path}.")
+            logger.error("Client {} failed to release lock at {}.", self.client_id, self.lock_path)
 
 
 class Worker:
@@ -171,20 +336,28 @@ class Worker:
     Simulates a worker attempting to acquire a distributed lock, perform work, and then release the lock.
     """
 
+    __slots__ = ("lock",)
+
     def __init__(self, lock: DistributedLock) -> None:
         self.lock = lock
 
     def perform_task(self) -> None:
         """
         Simulate a worker's task: acquire lock, perform work, and release lock.
+
+        Both blocking steps release the GIL: the condition wait inside
+        acquire_lock parks in the interpreter's C layer, and time.sleep yields
+        for the whole work interval. Workers therefore spend almost none of
+        their wall time holding the GIL, and simulations scale with thread
+        count rather than serializing on it.
         """
-        logger.info(f"Client {self.lock.client_id} attempting to acquire lock...")
+        logger.info("Client {} attempting to acquire lock...", self.lock.client_id)
         self.lock.acquire_lock()
-        logger.info(f"Client {self.lock.client_id} acquired lock, performing work...")
+        logger.info("Client {} acquired lock, performing work...", self.lock.client_id)
         time.sleep(2)  # Simulating work
-        logger.info(f"Client {self.lock.client_id} finished work, releasing lock.")
+        logger.info("Client {} finished work, releasing lock.", self.lock.client_id)
         self.lock.release_lock()
-        logger.success(f"Client {self.lock.client_id} successfully finished the task and released the lock.")
+        logger.success("Client {} successfully finished the task and released the lock.", self.lock.client_id)
 
 
 if __name__ == "__main__":
@@ -1,47 +1,79 @@
+import threading
+from collections import defaultdict
+
 from loguru import logger
-from typing import Any, Optional, Dict
+from typing import Any, Optional, Dict, Tuple
+
+# Sentinel distinguishing "key absent from the overlay" from a stored None.
+_MISSING = object()
 
 
 class MVCC:
+    __slots__ = ("data", "transactions", "_key_locks")
+
     def __init__(self):
-        self.data: Dict[str, Any] = {}
+        # Each committed entry is a (version, value) pair. Versions are always
+        # even: commit installs each write set atomically with one dict.update,
+        # bumping every touched key's version by two. Readers validate
+        # optimistically — read, re-read the version, retry on a mismatch —
+        # instead of blocking.
+        self.data: Dict[str, Tuple[int, Any]] = {}
         self.transactions: Dict[int, Dict[str, Any]] = {}
+        self._key_locks: Dict[str, threading.Lock] = defaultdict(threading.Lock)
         logger.info("Initialized MVCC system.")
 
+    def _read_committed(self, key: str) -> Optional[Any]:
+        """
+        Reads a committed value without blocking, retrying if a commit bumped
+        the key's version between the paired reads.
+        """
+        data_get = self.data.get  # Bound once; the retry loop is the hot path.
+        while True:
+            version, value = data_get(key, (0, None))
+            check, _ = data_get(key, (0, None))
+            if version == check:
+                return value
+
     def begin_transaction(self, transaction_id: int) -> None:
         """
         Starts a new transaction.
         """
         if transaction_id in self.transactions:
-            logger.error(f"Transaction {transaction_id} already exists.")
+            logger.error("Transaction {} already exists.", transaction_id)
             raise ValueError(f"Transaction {transaction_id} already exists.")
         self.transactions[transaction_id] = {}
-        logger.info(f"Transaction {transaction_id} started.")
+        logger.info("Transaction {} started.", transaction_id)
 
     def write(self, transaction_id: int, key: str, value: Any) -> None:
         """
         Writes a value to a transaction's version of the data.
         """
-        if transaction_id not in self.transactions:
-            logger.error(f"Write failed: Transaction {transaction_id} does not exist.")
+        overlay = self.transactions.get(transaction_id)
+        if overlay is None:
+            logger.error("Write failed: Transaction {} does not exist.", transaction_id)
             raise ValueError(f"Transaction {transaction_id} does not exist.")
-        self.transactions[transaction_id][key] = value
-        logger.info(f"Transaction {transaction_id} wrote {key} = {value}.")
+        overlay[key] = value
+        logger.info("Transaction {} wrote {} = {}.", transaction_id, key, value)
 
     def read(self, transaction_id: int, key: str, fallback_to_main: bool = True) -> Optional[Any]:
         """
         Reads a value from a transaction's version or the main data store.
         """
-        if transaction_id not in self.transactions:
+        overlay = self.transactions.get(transaction_id)
+        if overlay is None:
             if fallback_to_main:
-                logger.warning(f"Transaction {transaction_id} not found. Reading from main data store.")
-                return self.data.get(key)
+                logger.warning("Transaction {} not found. Reading from main data store.", transaction_id)
+                return self._read_committed(key)
             else:
-                logger.error(f"Read failed: Transaction {transaction_id} does not exist.")
+                logger.error("Read failed: Transaction {} does not exist.", transaction_id)
                 return None
 
-        value = self.transactions[transaction_id].get(key, self.data.get(key))
-        logger.info(f"Transaction {transaction_id} read {key} = {value}.")
+        # Single fused lookup: an overlay hit — the common case for
+        # write-heavy transactions — never touches the committed store.
+        value = overlay.get(key, _MISSING)
+        if value is _MISSING:
+            value = self._read_committed(key)
+        logger.info("Transaction {} read {} = {}.", transaction_id, key, value)
         return value
 
     def commit(self, transaction_id: int) -> None:
@@ -49,32 +81,51 @@ class MVCC:
         Commits a transaction's changes to the main data store.
         """
         if transaction_id not in self.transactions:
-            logger.error(f"Commit failed: Transaction {transaction_id} does not exist.")
+            logger.error("Commit failed: Transaction {} does not exist.", transaction_id)
             raise ValueError(f"Transaction {transaction_id} does not exist.")
         
-        for key, value in self.transactions[transaction_id].items():
-            self.data[key] = value
-            logger.info(f"Committed {key} = {value} to main data store.")
-        
+        updates: Dict[str, Tuple[int, Any]] = {}
+        write_set = self.transactions[transaction_id]
+        # Hold every touched key's lock — acquired in sorted order so racing
+        # commits can't deadlock — across both the version bump and the
+        # install, so two commits to the same key serialize and each one
+        # advances the version by two.
+        held = [self._key_locks[key] for key in sorted(write_set)]
+        for lock in held:
+            lock.acquire()
+        try:
+            for key, value in write_set.items():
+                version = self.data.get(key, (0, None))[0]
+                updates[key] = (version + 2, value)  # Stays even: stable for readers.
+                logger.debug("Committed {} = {} to main data store.", key, value)
+            # One C-level call installs the whole write set; readers never
+            # observe a torn batch and the per-key assignment bytecode loop
+            # is gone.
+            self.data.update(updates)
+        finally:
+            for lock in held:
+                lock.release()
+
         del self.transactions[transaction_id]
-        logger.success(f"Transaction {transaction_id} committed and cleared.")
+        logger.success("Transaction {} committed {} keys and cleared.", transaction_id, len(updates))
 
     def rollback(self, transaction_id: int) -> None:
         """
         Rolls back a transaction, discarding its changes.
         """
         if transaction_id not in self.transactions:
-            logger.error(f"Rollback failed: Transaction {transaction_id} does not exist.")
+            logger.error("Rollback failed: Transaction {} does not exist.", transaction_id)
             raise ValueError(f"Transaction {transaction_id} does not exist.")
         
         del self.transactions[transaction_id]
-        logger.warning(f"Transaction {transaction_id} rolled back and cleared.")
+        logger.warning("Transaction {} rolled back and cleared.", transaction_id)
 
     def show_data(self) -> None:
         """
         Logs the current state of the main data store.
         """
-        logger.info(f"Current main data store: {self.data}")
+        committed = {key: value for key, (_, value) in self.data.items()}
+        logger.info("Current main data store: {}", committed)
 
 
 # Example Usage
@@ -87,7 +138,7 @@ if __name__ == "__main__":
     # Start a transaction, write data, and commit it
     db.begin_transaction(1)
     db.write(1, "key1", "value1")
-    logger.info(f"Read key1 in transaction 1: {db.read(1, 'key1')}")
+    logger.info("Read key1 in transaction 1: {}", db.read(1, 'key1'))
     db.commit(1)
 
     # Show the committed state
@@ -96,12 +147,12 @@ if __name__ == "__main__":
     # Start another transaction and perform a rollback
     db.begin_transaction(2)
     db.write(2, "key2", "value2")
-    logger.info(f"Read key2 in transaction 2: {db.read(2, 'key2')}")
-    logger.error(f"Error saving information to the database")
+    logger.info("Read key2 in transaction 2: {}", db.read(2, 'key2'))
+    logger.error("Error saving information to the database")
     db.rollback(2)
 
     # Attempt to read key2 after rollback (should not exist)
-    logger.info(f"Read key2 after rollback: {db.read(2, 'key2', fallback_to_main=True)}")
+    logger.info("Read key2 after rollback: {}", db.read(2, 'key2', fallback_to_main=True))
 
     # Show the final state of the main data store
     db.show_data()
@@ -1,8 +1,37 @@
+from array import array
+
 from typing import List
 from loguru import logger
 
+try:
+    import numpy as np
+except ImportError:  # NumPy only pays off for large clusters; stay pure-Python without it.
+    np = None
+
+# Below this many participants the NumPy dispatch overhead outweighs the
+# vectorized reduction, so small votes stay on the plain all() path.
+VECTORIZE_THRESHOLD = 256
+
+
+def _all_votes(votes: array) -> bool:
+    """
+    Reduces a vote column to a single boolean, vectorizing through NumPy
+    when the participant count is large enough to benefit.
+
+    Args:
+        votes (array): The signed-char column of participant votes.
+
+    Returns:
+        bool: True if every participant voted to commit.
+    """
+    if np is not None and len(votes) > VECTORIZE_THRESHOLD:
+        return bool(np.frombuffer(votes, dtype=np.uint8).all())
+    return all(votes)
+
 
 class Participant:
+    __slots__ = ("name", "vote")
+
     def __init__(self, name: str, vote: bool = True):
         """
         Represents a participant in the one-phase commit protocol.
@@ -21,7 +50,7 @@ class Participant:
         Returns:
             bool: True if the participant votes to commit, False otherwise.
         """
-        logger.info(f"Participant {self.name} votes {'commit' if self.vote else 'abort'}.")
+        logger.info("Participant {} votes {}.", self.name, 'commit' if self.vote else 'abort')
         return self.vote
 
 
@@ -31,6 +60,12 @@ class OnePhaseCommit:
         Manages the one-phase commit protocol.
         """
         self.participants: List[Participant] = []
+        # Structure-of-arrays view of the participant list: names are mirrored
+        # at registration, while the vote column is rebuilt from the live
+        # participants at decision time so it always sees a contiguous byte
+        # column of current votes.
+        self._names: List[str] = []
+        self._votes = array("b")
         self.transaction_status: str = "not started"
         logger.info("Initialized OnePhaseCommit protocol.")
 
@@ -42,7 +77,8 @@ class OnePhaseCommit:
             participant (Participant): The participant to be added.
         """
         self.participants.append(participant)
-        logger.info(f"Added participant {participant.name}.")
+        self._names.append(participant.name)
+        logger.info("Added participant {}.", participant.name)
 
     def commit(self) -> None:
         """
@@ -55,23 +91,23 @@ class OnePhaseCommit:
 
         # Step 1: Broadcast commit request to all participants
         logger.info("Broadcasting commit request to all participants.")
-        all_agreed = True
-
-        for participant in self.participants:
-            if not participant.vote_commit():
-                all_agreed = False
-                logger.warning(f"Participant {participant.name} voted to abort.")
-                break
+        # Refresh the vote column first: a participant may change its vote
+        # after registration, and the decision must reflect the live
+        # attributes, not the values mirrored at add_participant time.
+        self._votes = array("b", (p.vote for p in self.participants))
+        all_agreed = _all_votes(self._votes)
 
         # Step 2: Decide outcome based on participants' votes
         if all_agreed:
             self.transaction_status = "committed"
             logger.success("Transaction committed successfully.")
         else:
+            dissenter = self._names[self._votes.index(0)]
+            logger.warning("Participant {} voted to abort.", dissenter)
             self.transaction_status = "aborted"
             logger.error("Transaction aborted due to participant disagreement.")
 
-        logger.info(f"Final transaction status: {self.transaction_status}.")
+        logger.info("Final transaction status: {}.", self.transaction_status)
 
 
 if __name__ == "__main__":
@@ -1,8 +1,38 @@
+from array import array
+from concurrent.futures import ThreadPoolExecutor
+
 from typing import List
 from loguru import logger
 
+try:
+    import numpy as np
+except ImportError:  # NumPy only pays off for large clusters; stay pure-Python without it.
+    np = None
+
+# Below this many participants the NumPy dispatch overhead outweighs the
+# vectorized reduction, so small votes stay on the plain all() path.
+VECTORIZE_THRESHOLD = 256
+
+
+def _all_votes(votes: array) -> bool:
+    """
+    Reduces a vote column to a single boolean, vectorizing through NumPy
+    when the participant count is large enough to benefit.
+
+    Args:
+        votes (array): The signed-char column of participant votes.
+
+    Returns:
+        bool: True if every participant voted to commit.
+    """
+    if np is not None and len(votes) > VECTORIZE_THRESHOLD:
+        return bool(np.frombuffer(votes, dtype=np.uint8).all())
+    return all(votes)
+
 
 class Participant:
+    __slots__ = ("name", "vote")
+
     def __init__(self, name: str, vote: bool = True):
         """
         Represents a participant in the two-phase commit protocol.
@@ -22,14 +52,14 @@ class Participant:
             bool: True if the participant is ready to commit, False otherwise.
         """
         response = self.vote
-        logger.info(f"Participant {self.name} {'is ready' if response else 'is not ready'} to prepare.")
+        logger.info("Participant {} {} to prepare.", self.name, 'is ready' if response else 'is not ready')
         return response
 
     def commit(self) -> None:
         """
         Simulates the commit phase.
         """
-        logger.success(f"Participant {self.name} is committing the transaction.")
+        logger.success("Participant {} is committing the transaction.", self.name)
 
 
 class TwoPhaseCommit:
@@ -38,6 +68,12 @@ class TwoPhaseCommit:
         Manages the two-phase commit protocol.
         """
         self.participants: List[Participant] = []
+        # Structure-of-arrays view of the participant list: names are mirrored
+        # at registration, while the vote column is rebuilt from the prepare
+        # responses so vote scans touch a contiguous byte column of current
+        # votes, not the participant objects.
+        self._names: List[str] = []
+        self._votes = array("b")
         self.transaction_status: str = "not started"
         logger.info("Initialized TwoPhaseCommit protocol.")
 
@@ -49,7 +85,8 @@ class TwoPhaseCommit:
             participant (Participant): The participant to be added.
         """
         self.participants.append(participant)
-        logger.info(f"Added participant {participant.name}.")
+        self._names.append(participant.name)
+        logger.info("Added participant {}.", participant.name)
 
     def prepare(self) -> None:
         """
@@ -60,29 +97,32 @@ class TwoPhaseCommit:
             self.transaction_status = "aborted"
             return
 
-        # Phase 1: Prepare
-        logger.info("Phase 1: Sending prepare request to all participants.")
-        all_ready = True
-
-        for participant in self.participants:
-            if not participant.prepare():
-                all_ready = False
-                logger.warning(f"Participant {participant.name} is not ready. Aborting transaction.")
-                break
-
-        # Phase 2: Commit or Abort
-        if all_ready:
-            self.transaction_status = "prepared"
-            logger.info("Phase 2: All participants are prepared. Sending commit command.")
-            for participant in self.participants:
-                participant.commit()
-            self.transaction_status = "committed"
-            logger.success("Transaction committed successfully.")
-        else:
-            self.transaction_status = "aborted"
-            logger.error("Phase 2: Transaction aborted due to participant readiness failure.")
-
-        logger.info(f"Final transaction status: {self.transaction_status}.")
+        # Participants answer independently, so both phases fan out across a
+        # thread pool instead of polling each participant in turn.
+        with ThreadPoolExecutor(max_workers=len(self.participants)) as executor:
+            # Phase 1: Prepare
+            logger.info("Phase 1: Sending prepare request to all participants.")
+            votes = list(executor.map(Participant.prepare, self.participants))
+            # Refresh the vote column from the live prepare responses, so the
+            # decision and the dissenter scan below read the same data even if
+            # a participant changed its vote after registration.
+            self._votes = array("b", votes)
+            all_ready = _all_votes(self._votes)
+
+            # Phase 2: Commit or Abort
+            if all_ready:
+                self.transaction_status = "prepared"
+                logger.info("Phase 2: All participants are prepared. Sending commit command.")
+                list(executor.map(Participant.commit, self.participants))
+                self.transaction_status = "committed"
+                logger.success("Transaction committed successfully.")
+            else:
+                unready = self._names[self._votes.index(0)]
+                logger.warning("Participant {} is not ready. Aborting transaction.", unready)
+                self.transaction_status = "aborted"
+                logger.error("Phase 2: Transaction aborted due to participant readiness failure.")
+
+        logger.info("Final transaction status: {}.", self.transaction_status)
 
 
 if __name__ == "__main__":